@@ -142,7 +142,7 @@ function Install-PythonEnv {
 
     $pipPath = Join-Path $script:InstallDir "venv\Scripts\pip.exe"
     & $pipPath install --quiet --upgrade pip
-    & $pipPath install --quiet pymupdf pillow
+    & $pipPath install --quiet pymupdf pillow numpy
 
     Pop-Location
 
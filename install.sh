@@ -133,7 +133,7 @@ setup_python() {
     # Install dependencies
     source venv/bin/activate
     pip install --quiet --upgrade pip
-    pip install --quiet pymupdf pillow
+    pip install --quiet pymupdf pillow numpy
 
     echo -e "${GREEN}✓ Python packages installed${NC}"
     echo ""
@@ -13,88 +13,181 @@ If output.pdf is not specified, creates input_clean.pdf
 import sys
 import os
 import io
+from functools import lru_cache
 import fitz  # PyMuPDF
+import numpy as np
 from PIL import Image
 
+# Maximum per-channel spread (0-255) between the sampled edge colors for the
+# logo area to be covered with a flat rectangle instead of a gradient image
+SOLID_FILL_TOLERANCE = 3
 
-def sample_color_averaged(pix, x, y, radius=2):
+# Edge colors are sampled this far outside/inside the logo area's edges,
+# averaging a square window of this radius around each sample point
+SAMPLE_OFFSET = 2
+SAMPLE_RADIUS = 2
+
+
+def pixmap_to_array(pix):
+    """Return a pixmap's samples as a (height, width, 3) RGB array."""
+    samples = np.frombuffer(pix.samples, dtype=np.uint8)
+    return samples.reshape(pix.height, pix.width, pix.n)[:, :, :3]
+
+
+def sample_color_averaged(pixels, x, y, radius=SAMPLE_RADIUS):
     """Sample and average colors in a small area to reduce noise."""
-    colors = []
-    for dx in range(-radius, radius + 1):
-        for dy in range(-radius, radius + 1):
-            sx = max(0, min(int(x + dx), pix.width - 1))
-            sy = max(0, min(int(y + dy), pix.height - 1))
-            pixel = pix.pixel(sx, sy)
-            colors.append((pixel[0], pixel[1], pixel[2]))
+    # Clamp the center into the pixmap so the window is never empty
+    height, width = pixels.shape[:2]
+    x = max(0, min(int(x), width - 1))
+    y = max(0, min(int(y), height - 1))
+    area = pixels[max(0, y - radius):y + radius + 1, max(0, x - radius):x + radius + 1]
 
     # Average all sampled colors
-    avg = tuple(sum(c[i] for c in colors) // len(colors) for i in range(3))
-    return avg
+    avg = area.reshape(-1, 3).mean(axis=0).astype(int)
+    return tuple(int(c) for c in avg)
+
+
+def sample_edge_colors(pixels, logo_left, logo_top, page_width, page_height):
+    """
+    Sample colors at key points around the logo area (averaged to reduce noise).
+
+    Returns:
+        (left_top, left_bot, top_left, top_right) RGB tuples
+    """
+    # Left edge: sample at multiple heights
+    left_top = sample_color_averaged(pixels, logo_left - SAMPLE_OFFSET, logo_top + SAMPLE_OFFSET)
+    left_bot = sample_color_averaged(pixels, logo_left - SAMPLE_OFFSET, page_height - SAMPLE_OFFSET)
+
+    # Top edge: sample at multiple positions
+    top_left = sample_color_averaged(pixels, logo_left + SAMPLE_OFFSET, logo_top - SAMPLE_OFFSET)
+    top_right = sample_color_averaged(pixels, page_width - SAMPLE_OFFSET, logo_top - SAMPLE_OFFSET)
+
+    return left_top, left_bot, top_left, top_right
+
+
+def solid_fill_color(edge_colors, tolerance=SOLID_FILL_TOLERANCE):
+    """
+    Return the average of the sampled edge colors as a PDF color (0-1 floats)
+    if they are close enough to treat the background as solid, else None.
+    """
+    samples = np.array(edge_colors)
+    if (samples.max(axis=0) - samples.min(axis=0)).max() > tolerance:
+        return None
+    return tuple(float(c) / 255 for c in samples.mean(axis=0))
 
 
-def create_gradient_overlay(pix, logo_left, logo_top, page_width, page_height):
+@lru_cache(maxsize=8)
+def gradient_weights(logo_width, logo_height):
+    """
+    Per-pixel weights of the four edge colors for a logo area of this size.
+
+    Only depends on the dimensions, which are the same for every page of a
+    deck, so it is computed once and cached.
+
+    Returns:
+        Read-only (logo_height, logo_width, 4) array of weights for
+        (left_top, left_bot, top_left, top_right)
+    """
+    # Normalized positions (0 to 1), shaped to broadcast over rows/columns
+    nx = np.linspace(0, 1, logo_width)[None, :]
+    ny = np.linspace(0, 1, logo_height)[:, None]
+
+    # Blend: weight left edge more at left, top edge more at top
+    weight_left = 1 - nx
+    weight_top = 1 - ny
+
+    # Normalize weights (both are zero only at the bottom-right pixel)
+    total_weight = weight_left + weight_top
+    zero = total_weight == 0
+    total_weight = np.where(zero, 1, total_weight)
+    weight_left = np.where(zero, 0.5, weight_left / total_weight)
+    weight_top = np.where(zero, 0.5, weight_top / total_weight)
+
+    # Left edge color is interpolated vertically, top edge color horizontally
+    weights = np.dstack([
+        weight_left * (1 - ny),
+        weight_left * ny,
+        weight_top * (1 - nx),
+        weight_top * nx,
+    ])
+    weights.setflags(write=False)
+    return weights
+
+
+def create_gradient_overlay(edge_colors, logo_left, logo_top, page_width, page_height):
     """
     Create a gradient image that blends smoothly with surrounding colors.
-    Samples colors around the logo area edges and creates a smooth gradient
-    using bilinear interpolation.
+    Takes the colors sampled around the logo area edges and creates a smooth
+    gradient using bilinear interpolation, as one weighted sum of the four
+    colors over precomputed weights.
     """
     # Logo area dimensions
     logo_width = int(page_width - logo_left)
     logo_height = int(page_height - logo_top)
 
-    # Sample colors at key points around the logo area (averaged to reduce noise)
-    # Left edge: sample at multiple heights
-    left_top = sample_color_averaged(pix, logo_left - 2, logo_top + 2)
-    left_bot = sample_color_averaged(pix, logo_left - 2, page_height - 2)
-
-    # Top edge: sample at multiple positions
-    top_left = sample_color_averaged(pix, logo_left + 2, logo_top - 2)
-    top_right = sample_color_averaged(pix, page_width - 2, logo_top - 2)
+    weights = gradient_weights(logo_width, logo_height)
 
     # Create gradient image (RGB, fully opaque)
-    gradient = Image.new('RGB', (logo_width, logo_height))
-
-    for y in range(logo_height):
-        for x in range(logo_width):
-            # Normalized positions (0 to 1)
-            nx = x / max(logo_width - 1, 1)
-            ny = y / max(logo_height - 1, 1)
-
-            # Interpolate left edge color (vertical)
-            left_color = tuple(
-                int(left_top[c] * (1 - ny) + left_bot[c] * ny)
-                for c in range(3)
-            )
-
-            # Interpolate top edge color (horizontal)
-            top_color = tuple(
-                int(top_left[c] * (1 - nx) + top_right[c] * nx)
-                for c in range(3)
-            )
-
-            # Blend: weight left edge more at left, top edge more at top
-            weight_left = 1 - nx
-            weight_top = 1 - ny
-
-            # Normalize weights
-            total_weight = weight_left + weight_top
-            if total_weight > 0:
-                weight_left /= total_weight
-                weight_top /= total_weight
-            else:
-                weight_left = weight_top = 0.5
-
-            # Final blended color
-            final_color = tuple(
-                int(left_color[c] * weight_left + top_color[c] * weight_top)
-                for c in range(3)
-            )
-
-            gradient.putpixel((x, y), final_color)
+    overlay = (weights @ np.array(edge_colors, dtype=float)).astype(np.uint8)
+    gradient = Image.fromarray(overlay)
 
     return gradient
 
 
+@lru_cache(maxsize=32)
+def encode_gradient_overlay(edge_colors, logo_left, logo_top, page_width, page_height):
+    """
+    Build the gradient overlay and encode it as PNG bytes for PyMuPDF.
+
+    Cached because slides sharing a template sample the same edge colors,
+    so the gradient is only built once per distinct background.
+    """
+    # Create gradient overlay that blends with surrounding colors
+    gradient = create_gradient_overlay(edge_colors, logo_left, logo_top, page_width, page_height)
+
+    # Convert PIL image to bytes for PyMuPDF
+    img_buffer = io.BytesIO()
+    gradient.save(img_buffer, format='PNG')
+    return img_buffer.getvalue()
+
+
+def process_page(doc, page_num, logo_left, logo_top):
+    """
+    Work out how to cover the logo on one page, without modifying it.
+
+    Returns:
+        (fill, png_bytes) - fill is a PDF color for a solid rectangle, or
+        None when png_bytes holds a gradient image instead
+    """
+    page = doc[page_num]
+    page_width = page.rect.width
+    page_height = page.rect.height
+
+    # Get pixmap for color sampling, rendering only the corner band the
+    # samples come from (sample offset + averaging radius around the logo)
+    margin = SAMPLE_OFFSET + SAMPLE_RADIUS
+    clip = fitz.Rect(logo_left - margin, logo_top - margin, page_width, page_height)
+    pix = page.get_pixmap(dpi=72, clip=clip)
+    pixels = pixmap_to_array(pix)
+
+    # Pixmap coordinates start at the clip's top-left corner
+    edge_colors = sample_edge_colors(
+        pixels,
+        logo_left - pix.x,
+        logo_top - pix.y,
+        page_width - pix.x,
+        page_height - pix.y
+    )
+
+    # Plain backgrounds only need a vector rectangle, no image
+    fill = solid_fill_color(edge_colors)
+    if fill is not None:
+        return fill, None
+
+    png_bytes = encode_gradient_overlay(edge_colors, logo_left, logo_top, page_width, page_height)
+    return None, png_bytes
+
+
 def scrub_logo(input_path, output_path=None):
     """
     Remove NotebookLM logo from each page of a PDF.
@@ -125,30 +218,26 @@ def scrub_logo(input_path, output_path=None):
 
     for page_num in range(len(doc)):
         page = doc[page_num]
-        page_width = page.rect.width
-        page_height = page.rect.height
-
-        # Get pixmap for color sampling
-        pix = page.get_pixmap(dpi=72)
 
-        # Create gradient overlay that blends with surrounding colors
-        gradient = create_gradient_overlay(pix, LOGO_LEFT, LOGO_TOP, page_width, page_height)
+        # Pages smaller than the standard export have no logo area to cover
+        if LOGO_LEFT >= page.rect.width or LOGO_TOP >= page.rect.height:
+            continue
 
-        # Convert PIL image to bytes for PyMuPDF
-        img_buffer = io.BytesIO()
-        gradient.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
+        fill, png_bytes = process_page(doc, page_num, LOGO_LEFT, LOGO_TOP)
 
         # Define the rectangle where the overlay goes
         logo_rect = fitz.Rect(
             LOGO_LEFT,
             LOGO_TOP,
-            page_width,
-            page_height
+            page.rect.width,
+            page.rect.height
         )
 
-        # Insert the gradient image over the logo area
-        page.insert_image(logo_rect, stream=img_buffer.getvalue())
+        if fill is not None:
+            page.draw_rect(logo_rect, color=None, fill=fill, overlay=True)
+        else:
+            # Insert the gradient image over the logo area
+            page.insert_image(logo_rect, stream=png_bytes)
 
         pages_processed += 1
 
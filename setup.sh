@@ -56,8 +56,8 @@ fi
 echo "[2/4] Installing Python dependencies..."
 source "$SCRIPT_DIR/venv/bin/activate"
 pip install --quiet --upgrade pip
-pip install --quiet pymupdf pillow
-echo "      Installed pymupdf, pillow"
+pip install --quiet pymupdf pillow numpy
+echo "      Installed pymupdf, pillow, numpy"
 
 # Step 3: Make scripts executable
 echo "[3/4] Setting permissions..."